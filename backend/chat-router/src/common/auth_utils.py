@@ -5,7 +5,11 @@ Bearerトークンの抽出やセッション・ユーザー情報の取得な
 ユーザー認証関連の共通処理をまとめるモジュール
 """
 
+import hashlib
+import hmac
+import logging
 import os
+import secrets
 import time
 from typing import Any, Dict, Optional
 
@@ -15,7 +19,109 @@ from botocore.exceptions import ClientError
 # DynamoDB設定
 _dynamodb = boto3.resource("dynamodb")
 _table_name = os.environ.get("CHATBOT_SETTINGS_TABLE", "ChatbotSettingsDB-dev")
-_table = _dynamodb.Table(_table_name)
+settings_table = _dynamodb.Table(_table_name)
+
+_logger = logging.getLogger(__name__)
+
+# パスワードハッシュ（scrypt）の設定
+_PASSWORD_HASH_SCHEME = "scrypt"
+_SCRYPT_N = 2**14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_DKLEN = 32
+_SCRYPT_SALT_BYTES = 16
+
+
+def _scrypt(password: str, salt: bytes) -> bytes:
+    """scryptで鍵導出を行う
+
+    Args:
+        password: プレーンテキストのパスワード
+        salt: ソルト
+
+    Returns:
+        導出されたハッシュ値
+    """
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=_SCRYPT_N,
+        r=_SCRYPT_R,
+        p=_SCRYPT_P,
+        dklen=_SCRYPT_DKLEN,
+    )
+
+
+def hash_password(password: str) -> str:
+    """パスワードをソルト付きscryptでハッシュ化する
+
+    Args:
+        password: プレーンテキストのパスワード
+
+    Returns:
+        "scrypt$<salt(16進数)>$<hash(16進数)>" 形式の文字列
+    """
+    salt = secrets.token_bytes(_SCRYPT_SALT_BYTES)
+    digest = _scrypt(password, salt)
+    return f"{_PASSWORD_HASH_SCHEME}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """パスワードが保存済みハッシュと一致するか検証する
+
+    scrypt形式に加え、移行前のソルト無しSHA-256（16進数64桁）も受け付ける
+
+    Args:
+        password: プレーンテキストのパスワード
+        stored_hash: DynamoDBに保存されているハッシュ
+
+    Returns:
+        一致する場合はTrue
+    """
+    if not stored_hash:
+        return False
+
+    if stored_hash.startswith(f"{_PASSWORD_HASH_SCHEME}$"):
+        try:
+            _, salt_hex, digest_hex = stored_hash.split("$")
+            salt = bytes.fromhex(salt_hex)
+            expected = bytes.fromhex(digest_hex)
+        except ValueError:
+            return False
+        return hmac.compare_digest(_scrypt(password, salt), expected)
+
+    # 旧形式（ソルト無しSHA-256）
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(legacy, stored_hash)
+
+
+def upgrade_legacy_password_hash(email: str, password: str, stored_hash: str) -> None:
+    """旧形式（ソルト無しSHA-256）のハッシュをscrypt形式に置き換える
+
+    ログイン成功時に呼び出す。既にscrypt形式の場合は何もしない。
+    更新に失敗してもログイン自体は継続できるよう、例外は送出しない
+
+    Args:
+        email: メールアドレス（小文字化済み）
+        password: 検証済みのプレーンテキストのパスワード
+        stored_hash: DynamoDBに保存されているハッシュ
+    """
+    if stored_hash.startswith(f"{_PASSWORD_HASH_SCHEME}$"):
+        return
+
+    try:
+        # 同時にパスワードが変更された場合は上書きしない
+        settings_table.update_item(
+            Key={"PK": f"USER#{email}", "SK": "PROFILE"},
+            UpdateExpression="SET passwordHash = :newHash",
+            ConditionExpression="passwordHash = :oldHash",
+            ExpressionAttributeValues={
+                ":newHash": hash_password(password),
+                ":oldHash": stored_hash,
+            },
+        )
+    except ClientError as e:
+        _logger.warning("Failed to upgrade legacy password hash: %s", e)
 
 
 def extract_bearer_token(headers: Dict[str, str]) -> Optional[str]:
@@ -47,7 +153,7 @@ def get_authenticated_session(headers: Dict[str, str]) -> Optional[Dict[str, Any
         return None
 
     try:
-        resp = _table.get_item(Key={"PK": f"SESSION#{token}", "SK": "INFO"})
+        resp = settings_table.get_item(Key={"PK": f"SESSION#{token}", "SK": "INFO"})
         if "Item" not in resp:
             return None
 
@@ -82,7 +188,7 @@ def get_authenticated_user(headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
         user_key = {"PK": f"USER#{session['email']}", "SK": "PROFILE"}
         logger.info(f"Looking up user with key: {user_key}")
         
-        user_resp = _table.get_item(Key=user_key)
+        user_resp = settings_table.get_item(Key=user_key)
         if "Item" not in user_resp:
             logger.info(f"No user found for email: {session['email']}")
             return None
@@ -3,9 +3,13 @@
 Lambda関数で使用する共通のレスポンス生成ロジックを提供する
 """
 
-import json
-from datetime import datetime
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from common.utils import json_dumps
+except ImportError:
+    from .utils import json_dumps
 
 # レスポンス用のヘッダー定義
 WEBHOOK_HEADERS: Dict[str, str] = {
@@ -13,6 +17,24 @@ WEBHOOK_HEADERS: Dict[str, str] = {
     "Access-Control-Allow-Origin": "*",
 }
 
+# 直近に整形した時刻（UNIX秒, ISO 8601文字列）のキャッシュ
+_iso_now_cache: List[Any] = [0, ""]
+
+
+def utc_now_iso() -> str:
+    """現在のUTC時刻をISO 8601形式（秒精度、タイムゾーン表記なし）で取得
+
+    同じ秒のうちは前回整形した文字列を再利用する
+
+    Returns:
+        str: ISO 8601形式の時刻文字列
+    """
+    now = int(time.time())
+    if now != _iso_now_cache[0]:
+        _iso_now_cache[0] = now
+        _iso_now_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+    return _iso_now_cache[1]
+
 
 def create_success_response(data: Dict[str, Any], status_code: int = 200) -> dict:
     """成功レスポンスを生成
@@ -27,17 +49,20 @@ def create_success_response(data: Dict[str, Any], status_code: int = 200) -> dic
     return {
         "statusCode": status_code,
         "headers": WEBHOOK_HEADERS,
-        "body": json.dumps(data, ensure_ascii=False),
+        "body": json_dumps(data),
     }
 
 
-def create_error_response(status_code: int, error: str, message: str) -> dict:
+def create_error_response(
+    status_code: int, error: str, message: str, timestamp: Optional[str] = None
+) -> dict:
     """エラーレスポンスを生成
 
     Args:
         status_code: HTTPステータスコード
         error: エラータイプ
         message: エラーメッセージ
+        timestamp: レスポンスに含める時刻（省略時は現在時刻）
 
     Returns:
         dict: レスポンスオブジェクト
@@ -45,19 +70,18 @@ def create_error_response(status_code: int, error: str, message: str) -> dict:
     return {
         "statusCode": status_code,
         "headers": WEBHOOK_HEADERS,
-        "body": json.dumps(
+        "body": json_dumps(
             {
                 "error": error,
                 "message": message,
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-            ensure_ascii=False,
+                "timestamp": timestamp or utc_now_iso(),
+            }
         ),
     }
 
 
 def create_platform_success_response(
-    platform: str, room_key: str, message_ts: int
+    platform: str, room_key: str, message_ts: int, timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """プラットフォーム用成功レスポンスデータを生成
 
@@ -65,6 +89,7 @@ def create_platform_success_response(
         platform: プラットフォーム名
         room_key: ルームキー
         message_ts: メッセージタイムスタンプ
+        timestamp: レスポンスに含める時刻（省略時は現在時刻）
 
     Returns:
         dict: レスポンスデータ
@@ -73,18 +98,21 @@ def create_platform_success_response(
         "status": "success",
         "platform": platform,
         "message": f"{platform.capitalize()} webhook processed successfully",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp or utc_now_iso(),
         "roomKey": room_key,
         "messageTs": message_ts,
     }
 
 
-def create_ignored_response(platform: str, reason: str) -> Dict[str, Any]:
+def create_ignored_response(
+    platform: str, reason: str, timestamp: Optional[str] = None
+) -> Dict[str, Any]:
     """無視されたイベント用のレスポンスデータを生成
 
     Args:
         platform: プラットフォーム名
         reason: 無視された理由
+        timestamp: レスポンスに含める時刻（省略時は現在時刻）
 
     Returns:
         dict: レスポンスデータ
@@ -93,5 +121,5 @@ def create_ignored_response(platform: str, reason: str) -> Dict[str, Any]:
         "status": "ignored",
         "platform": platform,
         "message": reason,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp or utc_now_iso(),
     } 
\ No newline at end of file
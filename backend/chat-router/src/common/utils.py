@@ -3,11 +3,29 @@
 プロジェクト全体で使用される共通処理をまとめたモジュール
 """
 
+import json
 import time
 import secrets
 from typing import Any, Dict, Union
 from decimal import Decimal
 
+# orjsonが利用可能な場合は高速なC実装を使用し、無い環境では標準jsonにフォールバック
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def current_time_ms() -> int:
+    """現在時刻をUNIXミリ秒で取得
+
+    time.time_ns()の整数演算で求めるため、浮動小数点の丸め誤差が生じない
+
+    Returns:
+        int: 現在時刻（ミリ秒）
+    """
+    return time.time_ns() // 1_000_000
+
 
 def convert_decimal_to_int(value: Any) -> Any:
     """DynamoDBのDecimal型をint/floatに変換
@@ -38,6 +56,43 @@ def convert_decimal_in_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     return converted
 
 
+def json_dumps(data: Any) -> str:
+    """オブジェクトをJSON文字列に変換
+
+    orjsonが利用可能であればそちらを使用する（非ASCII文字はエスケープしない）
+
+    Args:
+        data: 変換するオブジェクト
+
+    Returns:
+        str: JSON文字列
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # 文字列以外のキーなどorjsonが扱えない値は標準jsonで変換する
+            pass
+    return json.dumps(data, ensure_ascii=False)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """JSON文字列をパース
+
+    orjsonが利用可能であればそちらを使用する。
+    どちらの実装でも失敗時は json.JSONDecodeError（のサブクラス）を送出する
+
+    Args:
+        data: JSON文字列
+
+    Returns:
+        パースされたオブジェクト
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def generate_time_ordered_uuid() -> str:
     """時間順序付きUUIDを生成
     
@@ -49,7 +104,7 @@ def generate_time_ordered_uuid() -> str:
         str: 時間順序付きUUID（例: 18c5f2a1b2d-a3f7e8d9c4b5f6g2h1i9j8k7）
     """
     # ミリ秒タイムスタンプを16進数に変換
-    timestamp_ms = int(time.time() * 1000)
+    timestamp_ms = current_time_ms()
     timestamp_hex = format(timestamp_ms, 'x')
     
     # 暗号学的に安全な24桁のランダム文字列（96ビット）
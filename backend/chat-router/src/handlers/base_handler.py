@@ -6,10 +6,15 @@
 import logging
 import hmac
 import hashlib
-import base64
-from typing import Any, Dict, Optional
+from typing import Any, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
+# SIMD実装のpybase64が利用可能であれば使用し、無い環境では標準base64を使用
+try:
+    import pybase64 as b64
+except ImportError:
+    import base64 as b64
+
 # Lambda実行環境でのモジュールインポートを確保
 try:
     import storage
@@ -19,6 +24,7 @@ try:
         create_error_response,
         create_platform_success_response,
         create_ignored_response,
+        utc_now_iso,
     )
 except ImportError:
     from .. import storage
@@ -28,6 +34,7 @@ except ImportError:
         create_error_response,
         create_platform_success_response,
         create_ignored_response,
+        utc_now_iso,
     )
 
 # ログ設定
@@ -47,6 +54,12 @@ class BaseWebhookHandler(ABC):
         """
         self.platform_name = platform_name
         self.signing_secret = signing_secret
+        # HMACの鍵スケジュールは一度だけ計算し、リクエストごとにcopy()して使う
+        self._hmac_prototype = (
+            hmac.new(signing_secret.encode(), digestmod=hashlib.sha256)
+            if signing_secret
+            else None
+        )
 
     def handle(self, body: Any, event: dict) -> dict:
         """Webhookの処理メインメソッド
@@ -58,13 +71,19 @@ class BaseWebhookHandler(ABC):
         Returns:
             dict: レスポンスオブジェクト
         """
+        # レスポンスに含める時刻はリクエストごとに一度だけ生成する
+        timestamp = utc_now_iso()
+
         try:
             logger.info(f"Processing {self.platform_name} webhook")
 
             # 署名検証
             if not self._verify_signature(body, event):
                 return create_error_response(
-                    401, "Unauthorized", f"Invalid {self.platform_name} signature"
+                    401,
+                    "Unauthorized",
+                    f"Invalid {self.platform_name} signature",
+                    timestamp,
                 )
 
             # プラットフォーム固有の前処理
@@ -72,32 +91,43 @@ class BaseWebhookHandler(ABC):
                 return pre_result
 
             # メッセージの正規化
-            message = self._normalize_message(body)
-            if not message:
+            messages = self._normalize_messages(body)
+            if not messages:
                 # メッセージイベント以外の場合は正常処理として扱う
                 return create_success_response(
                     create_ignored_response(
                         self.platform_name,
                         f"Non-message {self.platform_name} event ignored",
+                        timestamp,
                     )
                 )
 
-            # バイナリデータの処理
-            message = self._process_binary_data(message, body)
+            # メッセージの保存（複数件はBatchWriteItemでまとめて保存、
+            # バイナリデータ付きはS3アップロードとDynamoDB書き込みを並行実行）
+            binary_data, file_extension = self._get_binary_data(body)
+            if len(messages) > 1:
+                storage.save_messages(messages)
+            elif binary_data:
+                storage.save_message_with_binary(
+                    messages[0], binary_data, file_extension
+                )
+            else:
+                storage.save_message(messages[0])
 
-            # メッセージの保存
-            storage.save_message(message)
+            message = messages[0]
 
             # 成功レスポンス
             response_data = create_platform_success_response(
-                self.platform_name, message.room_key, message.ts
+                self.platform_name, message.room_key, message.ts, timestamp
             )
 
             return create_success_response(response_data)
 
         except Exception as e:
             logger.error(f"Error processing {self.platform_name} webhook: %s", str(e))
-            return create_error_response(500, "Internal Server Error", str(e))
+            return create_error_response(
+                500, "Internal Server Error", str(e), timestamp
+            )
 
     @abstractmethod
     def _verify_signature(self, body: Any, event: dict) -> bool:
@@ -124,6 +154,20 @@ class BaseWebhookHandler(ABC):
         """
         pass
 
+    def _normalize_messages(self, body: Any) -> List[UnifiedMessage]:
+        """メッセージ正規化（複数件対応）
+
+        1つのWebhookに複数のイベントを含むプラットフォームはオーバーライドする
+
+        Args:
+            body: リクエストボディ
+
+        Returns:
+            正規化されたメッセージのリスト
+        """
+        message = self._normalize_message(body)
+        return [message] if message else []
+
     def _pre_process(self, body: Any, event: dict) -> Optional[dict]:
         """前処理（オプション）
 
@@ -136,41 +180,65 @@ class BaseWebhookHandler(ABC):
         """
         return None
 
-    def _process_binary_data(
-        self, message: UnifiedMessage, body: Any
-    ) -> UnifiedMessage:
-        """バイナリデータの処理（オプション）
+    def _get_binary_data(self, body: Any) -> Tuple[Optional[Any], Optional[str]]:
+        """添付バイナリデータの取得（オプション）
 
         Args:
-            message: 正規化されたメッセージ
             body: リクエストボディ
 
         Returns:
-            バイナリデータ処理済みのメッセージ
+            (バイナリデータ, ファイル拡張子)のタプル、添付が無い場合は(None, None)
         """
-        return message
+        return None, None
 
-    def _hmac_sha256(self, key: str, data: str) -> str:
+    def _get_raw_body(self, event: dict) -> bytes:
+        """署名検証用に送信元が送った生のリクエストボディを取得
+
+        UTF-8として不正なボディでも署名検証（401）まで到達できるよう、
+        文字列にはデコードせずバイト列のまま返す
+
+        Args:
+            event: Lambda event オブジェクト
+
+        Returns:
+            生のリクエストボディ（バイト列）
+        """
+        raw_body = event.get("body") or ""
+        if event.get("isBase64Encoded"):
+            return b64.b64decode(raw_body)
+        return raw_body.encode("utf-8")
+
+    def _hmac_sha256(self, data: Union[str, bytes]) -> str:
         """HMAC-SHA256ハッシュの生成
 
         Args:
-            key: シークレットキー
-            data: ハッシュ対象データ
+            data: ハッシュ対象データ（文字列の場合はUTF-8でエンコード）
 
         Returns:
             ハッシュ値（16進数）
         """
-        return hmac.new(key.encode(), data.encode(), hashlib.sha256).hexdigest()
+        return self._hmac_digest(data).hex()
 
-    def _hmac_sha256_b64(self, key: str, data: str) -> str:
+    def _hmac_sha256_b64(self, data: Union[str, bytes]) -> str:
         """HMAC-SHA256ハッシュの生成（Base64エンコード）
 
         Args:
-            key: シークレットキー
-            data: ハッシュ対象データ
+            data: ハッシュ対象データ（文字列の場合はUTF-8でエンコード）
 
         Returns:
             Base64エンコードされたハッシュ値
         """
-        hash_value = hmac.new(key.encode(), data.encode(), hashlib.sha256).digest()
-        return base64.b64encode(hash_value).decode()
+        return b64.b64encode(self._hmac_digest(data)).decode()
+
+    def _hmac_digest(self, data: Union[str, bytes]) -> bytes:
+        """署名用シークレットでHMAC-SHA256ダイジェストを計算
+
+        Args:
+            data: ハッシュ対象データ（文字列の場合はUTF-8でエンコード）
+
+        Returns:
+            ダイジェスト（バイト列）
+        """
+        mac = self._hmac_prototype.copy()
+        mac.update(data.encode() if isinstance(data, str) else data)
+        return mac.digest()
@@ -6,7 +6,7 @@
 import json
 import hmac
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Optional, Tuple
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
@@ -88,7 +88,7 @@ class CustomWebhookHandler(BaseWebhookHandler):
             return False
 
         # 署名の検証
-        my_signature = self._hmac_sha256(self.signing_secret, json.dumps(body))
+        my_signature = self._hmac_sha256(self._get_raw_body(event))
 
         return hmac.compare_digest(my_signature, signature)
 
@@ -103,23 +103,13 @@ class CustomWebhookHandler(BaseWebhookHandler):
         """
         return self.normalizer.normalize(body)
 
-    def _process_binary_data(
-        self, message: UnifiedMessage, body: Any
-    ) -> UnifiedMessage:
-        """バイナリデータの処理
+    def _get_binary_data(self, body: Any) -> Tuple[Optional[Any], Optional[str]]:
+        """添付バイナリデータの取得
 
         Args:
-            message: 正規化されたメッセージ
             body: リクエストボディ
 
         Returns:
-            バイナリデータ処理済みのメッセージ
+            (バイナリデータ, ファイル拡張子)のタプル
         """
-        # バイナリデータの処理
-        binary_data = body.get("binaryData")
-        file_extension = body.get("fileExtension")
-
-        if binary_data:
-            message = storage.process_binary_data(message, binary_data, file_extension)
-
-        return message
+        return body.get("binaryData"), body.get("fileExtension")
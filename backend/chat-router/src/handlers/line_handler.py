@@ -3,10 +3,9 @@
 LINEからのWebhookリクエストを処理する
 """
 
-import json
 import hmac
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, List, Optional
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
@@ -49,7 +48,7 @@ class LineWebhookHandler(BaseWebhookHandler):
             return False
 
         # 署名の検証
-        my_signature = self._hmac_sha256_b64(self.signing_secret, json.dumps(body))
+        my_signature = self._hmac_sha256_b64(self._get_raw_body(event))
 
         return hmac.compare_digest(my_signature, signature)
 
@@ -63,3 +62,14 @@ class LineWebhookHandler(BaseWebhookHandler):
             正規化されたメッセージ、または有効なメッセージでない場合はNone
         """
         return self.normalizer.normalize(body)
+
+    def _normalize_messages(self, body: Any) -> List[UnifiedMessage]:
+        """webhookに含まれる全メッセージイベントの正規化
+
+        Args:
+            body: リクエストボディ
+
+        Returns:
+            正規化されたメッセージのリスト
+        """
+        return self.normalizer.normalize_events(body)
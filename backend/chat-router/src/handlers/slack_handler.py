@@ -3,10 +3,9 @@
 SlackからのWebhookリクエストを処理する
 """
 
-import json
 import hmac
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
@@ -47,14 +46,14 @@ class SlackWebhookHandler(BaseWebhookHandler):
 
         timestamp = event.get("headers", {}).get("x-slack-request-timestamp", "")
         signature = event.get("headers", {}).get("x-slack-signature", "")
-        raw_body = event.get("body", "")  # 署名検証には生のボディが必要
+        raw_body = self._get_raw_body(event)  # 署名検証には生のボディが必要
 
         if not timestamp or not signature:
             return False
 
         # 署名の検証
-        base_string = f"v0:{timestamp}:{raw_body}"
-        my_signature = "v0=" + self._hmac_sha256(self.signing_secret, base_string)
+        base_string = f"v0:{timestamp}:".encode() + raw_body
+        my_signature = "v0=" + self._hmac_sha256(base_string)
 
         return hmac.compare_digest(my_signature, signature)
 
@@ -4,7 +4,7 @@ Microsoft TeamsからのWebhookリクエストを処理する
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
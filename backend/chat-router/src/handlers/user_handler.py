@@ -9,7 +9,6 @@ import os
 import uuid
 import time
 import json
-import hashlib
 import secrets
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
@@ -24,6 +23,9 @@ try:
         get_authenticated_session,
         get_authenticated_user,
         get_authenticated_admin,
+        hash_password,
+        upgrade_legacy_password_hash,
+        verify_password,
     )
     from common.utils import convert_decimal_to_int, generate_time_ordered_uuid
     from services.auth_service import AuthService
@@ -34,6 +36,9 @@ except ImportError:
         get_authenticated_session,
         get_authenticated_user,
         get_authenticated_admin,
+        hash_password,
+        upgrade_legacy_password_hash,
+        verify_password,
     )
     from ..common.utils import convert_decimal_to_int, generate_time_ordered_uuid
     from ..services.auth_service import AuthService
@@ -150,25 +155,13 @@ class UserHandler:
                 500, "Internal Server Error", "ユーザー処理中にエラーが発生しました"
             )
 
-    def _hash_password(self, password: str) -> str:
-        """パスワードのハッシュ化
-
-        Args:
-            password: プレーンテキストのパスワード
-
-        Returns:
-            ハッシュ化されたパスワード
-        """
-        # SHA-256でハッシュ化（本番環境ではbcryptなどを推奨）
-        return hashlib.sha256(password.encode()).hexdigest()
-
     def _generate_token(self) -> str:
         """セッショントークンの生成
 
         Returns:
-            ランダムなトークン文字列
+            ランダムなトークン文字列（256ビット、16進数64桁）
         """
-        return secrets.token_urlsafe(32)
+        return secrets.token_bytes(32).hex()
 
     def _handle_register(self, body: Union[str, Dict]) -> Dict[str, Any]:
         """新規ユーザー登録
@@ -228,7 +221,7 @@ class UserHandler:
                 "userId": user_id,
                 "email": email,
                 "name": name,
-                "passwordHash": self._hash_password(password),
+                "passwordHash": hash_password(password),
                 "role": "user",  # デフォルトロール
                 "createdAt": current_time,
                 "updatedAt": current_time,
@@ -300,13 +293,16 @@ class UserHandler:
             user = response["Item"]
 
             # パスワードの検証
-            if user["passwordHash"] != self._hash_password(password):
+            if not verify_password(password, user.get("passwordHash", "")):
                 return create_error_response(
                     401,
                     "Unauthorized",
                     "メールアドレスまたはパスワードが正しくありません",
                 )
 
+            # 旧形式のハッシュはログイン成功時にscrypt形式へ移行
+            upgrade_legacy_password_hash(email, password, user["passwordHash"])
+
             # アクティブユーザーかチェック
             if not user.get("isActive", True):
                 return create_error_response(
@@ -476,7 +472,7 @@ class UserHandler:
                 "email": new_email,
                 "name": new_name.strip(),
                 "passwordHash": (
-                    self._hash_password(new_password)
+                    hash_password(new_password)
                     if new_password
                     else current_user["passwordHash"]
                 ),
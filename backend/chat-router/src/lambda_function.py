@@ -11,12 +11,14 @@ from typing import Any, Dict
 try:
     import webhook_handler
     from common.responses import create_error_response, create_success_response
+    from common.utils import json_loads
     from handlers.bot_settings_handler import BotSettingsHandler
     from handlers.user_handler import UserHandler
     from handlers.chat_handler import ChatHandler
 except ImportError:
     from . import webhook_handler
     from .common.responses import create_error_response, create_success_response
+    from .common.utils import json_loads
     from .handlers.bot_settings_handler import BotSettingsHandler
     from .handlers.user_handler import UserHandler
     from .handlers.chat_handler import ChatHandler
@@ -28,6 +30,11 @@ logger.setLevel(logging.INFO)
 # 環境変数からバージョンを取得（デフォルト値を設定）
 VERSION = os.environ.get("VERSION")
 
+# 受け付けるリクエストボディの最大バイト数
+# 3MBの添付ファイル（Base64で4MB）とJSONの余白（256KB）を見込んだ値。
+# Lambda同期呼び出しの上限6MBはイベント全体に対するものなので、それより十分小さくする
+MAX_BODY_SIZE = int(os.environ.get("MAX_BODY_SIZE", 4 * 1024 * 1024 + 256 * 1024))
+
 # CORS および共通ヘッダ定義
 COMMON_HEADERS: Dict[str, str] = {
     "Content-Type": "application/json",
@@ -60,9 +67,21 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         statusCode、headers、bodyを含む辞書
     """
+    # EventBridgeの定期実行（ウォームアップ）はルーティングせずに即座に返す
+    if event.get("source") == "aws.events":
+        return create_success_response({"status": "warm"})
+
     try:
         # バージョン情報をログ出力
         logger.info("ChatRouter Lambda started - Version: %s", VERSION)
+
+        # 上限を超えるボディはイベントのダンプやパースより前に拒否
+        raw_body = event.get("body", "")
+        if raw_body and _exceeds_max_body_size(raw_body):
+            return create_error_response(
+                413, "Payload Too Large", "リクエストボディが大きすぎます"
+            )
+
         logger.info("Received event: %s", json.dumps(event))
 
         # HTTPメソッドとパスを取得
@@ -76,11 +95,10 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # クエリパラメータを取得
         query_params = event.get("queryStringParameters", {}) or {}
 
-        # リクエストボディを取得し JSON としてパース（失敗時は元文字列を保持）
-        raw_body = event.get("body", "")
+        # リクエストボディを JSON としてパース（失敗時は元文字列を保持）
         if raw_body:
             try:
-                body = json.loads(raw_body)
+                body = json_loads(raw_body)
             except json.JSONDecodeError as e:
                 logger.warning("Failed to parse JSON body: %s", str(e))
                 body = raw_body
@@ -171,6 +189,24 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
 
 
+def _exceeds_max_body_size(raw_body: str) -> bool:
+    """リクエストボディがMAX_BODY_SIZE（バイト）を超えるか判定
+
+    UTF-8では1文字が1〜4バイトのため、文字数だけで判定できない場合のみエンコードする
+
+    Args:
+        raw_body: リクエストボディ
+
+    Returns:
+        bool: 上限を超える場合はTrue
+    """
+    if len(raw_body) > MAX_BODY_SIZE:
+        return True
+    if len(raw_body) * 4 <= MAX_BODY_SIZE:
+        return False
+    return len(raw_body.encode("utf-8")) > MAX_BODY_SIZE
+
+
 def _handle_options_request() -> Dict[str, Any]:
     """CORS プリフライトリクエストのハンドリング
 
@@ -4,6 +4,7 @@
 """
 
 import logging
+import sys
 import time
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
@@ -19,6 +20,25 @@ except ImportError:
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# コンテンツタイプ定数（sys.internで共有インスタンスに正規化）
+CONTENT_TYPE_TEXT = sys.intern("text")
+CONTENT_TYPE_IMAGE = sys.intern("image")
+CONTENT_TYPE_VIDEO = sys.intern("video")
+CONTENT_TYPE_AUDIO = sys.intern("audio")
+CONTENT_TYPE_FILE = sys.intern("file")
+
+# 既知のコンテンツタイプ → 正規化済みインスタンス
+CONTENT_TYPES: Dict[str, str] = {
+    ct: ct
+    for ct in (
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_VIDEO,
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+    )
+}
+
 
 class BaseNormalizer(ABC):
     """メッセージ正規化の基底クラス"""
@@ -43,6 +63,20 @@ class BaseNormalizer(ABC):
         """
         pass
 
+    def _canonical_content_type(self, content_type: str) -> str:
+        """コンテンツタイプを正規化済みの共有インスタンスに変換
+
+        ペイロード由来の文字列は毎回別オブジェクトになるため、既知の値は
+        モジュール定数に置き換えて下流の辞書操作を安価にする
+
+        Args:
+            content_type: コンテンツタイプ文字列
+
+        Returns:
+            正規化されたコンテンツタイプ（未知の値はそのまま）
+        """
+        return CONTENT_TYPES.get(content_type, content_type)
+
     def _parse_timestamp_to_ms(
         self, timestamp: Optional[Union[str, int, float]]
     ) -> int:
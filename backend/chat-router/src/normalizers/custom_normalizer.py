@@ -10,10 +10,18 @@ from typing import Any, Dict, Optional
 # Lambda実行環境でのモジュールインポートを確保
 try:
     from common.message import UnifiedMessage
-    from normalizers.base_normalizer import BaseNormalizer
+    from normalizers.base_normalizer import (
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_TEXT,
+        BaseNormalizer,
+    )
 except ImportError:
     from ..common.message import UnifiedMessage
-    from .base_normalizer import BaseNormalizer
+    from .base_normalizer import (
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_TEXT,
+        BaseNormalizer,
+    )
 
 # ログ設定
 logger = logging.getLogger()
@@ -59,13 +67,17 @@ class CustomNormalizer(BaseNormalizer):
             room_key = f"custom:{room_id}"
 
             # コンテンツタイプの判定
-            content_type = payload.get("contentType", "text")
+            content_type = self._canonical_content_type(
+                payload.get("contentType", CONTENT_TYPE_TEXT)
+            )
             s3_uri = None
 
             # バイナリデータの処理
             binary_data = payload.get("binaryData")
             if binary_data:
-                content_type = payload.get("contentType", "file")
+                content_type = self._canonical_content_type(
+                    payload.get("contentType", CONTENT_TYPE_FILE)
+                )
 
             return UnifiedMessage(
                 platform=self.platform_name,
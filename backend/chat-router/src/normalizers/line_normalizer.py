@@ -5,20 +5,39 @@ LINEからのメッセージを統一フォーマットに正規化する
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
     from common.message import UnifiedMessage
-    from normalizers.base_normalizer import BaseNormalizer
+    from normalizers.base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 except ImportError:
     from ..common.message import UnifiedMessage
-    from .base_normalizer import BaseNormalizer
+    from .base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 
 # ログ設定
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# S3保存対象となるバイナリのコンテンツタイプ
+_BINARY_CONTENT_TYPES = frozenset(
+    (CONTENT_TYPE_IMAGE, CONTENT_TYPE_VIDEO, CONTENT_TYPE_AUDIO, CONTENT_TYPE_FILE)
+)
+
 
 class LineNormalizer(BaseNormalizer):
     """LINEメッセージの正規化クラス"""
@@ -27,7 +46,7 @@ class LineNormalizer(BaseNormalizer):
         super().__init__("line")
 
     def normalize(self, payload: Dict[str, Any]) -> Optional[UnifiedMessage]:
-        """LINEメッセージの正規化
+        """LINEメッセージの正規化（最初のイベントのみ）
 
         Args:
             payload: LINE webhook ペイロード
@@ -35,16 +54,54 @@ class LineNormalizer(BaseNormalizer):
         Returns:
             正規化されたメッセージ、または有効なメッセージイベントでない場合はNone
         """
-        try:
-            # LINEのWebhookイベントを取得
-            events = payload.get("events", [])
-            if not events or len(events) == 0:
-                logger.info("No events in LINE payload")
-                return None
+        # LINEのWebhookイベントを取得
+        events = self._get_events(payload)
+        if not events:
+            logger.info("No events in LINE payload")
+            return None
 
-            # 最初のイベントのみ処理
-            event = events[0]
+        # 最初のイベントのみ処理
+        return self._normalize_event(events[0])
 
+    def normalize_events(self, payload: Dict[str, Any]) -> List[UnifiedMessage]:
+        """LINE webhookに含まれる全てのメッセージイベントを正規化
+
+        Args:
+            payload: LINE webhook ペイロード
+
+        Returns:
+            正規化されたメッセージのリスト（メッセージイベント以外は除外）
+        """
+        messages = []
+        for event in self._get_events(payload):
+            message = self._normalize_event(event)
+            if message:
+                messages.append(message)
+        return messages
+
+    def _get_events(self, payload: Any) -> List[Dict[str, Any]]:
+        """ペイロードからイベント一覧を取得
+
+        Args:
+            payload: LINE webhook ペイロード
+
+        Returns:
+            イベントのリスト（ペイロードが不正な場合は空リスト）
+        """
+        if not isinstance(payload, dict):
+            return []
+        return payload.get("events") or []
+
+    def _normalize_event(self, event: Dict[str, Any]) -> Optional[UnifiedMessage]:
+        """LINEイベント1件の正規化
+
+        Args:
+            event: LINE webhook イベント
+
+        Returns:
+            正規化されたメッセージ、または有効なメッセージイベントでない場合はNone
+        """
+        try:
             # メッセージイベントかチェック
             if event.get("type") != "message":
                 logger.info("Not a message event: %s", event.get("type"))
@@ -69,11 +126,11 @@ class LineNormalizer(BaseNormalizer):
             room_key = f"line:{source_type}:{source_id}"
 
             # コンテンツタイプの判定
-            content_type = message_type or "text"
+            content_type = self._canonical_content_type(message_type or CONTENT_TYPE_TEXT)
             s3_uri = None
 
             # 添付ファイルの処理（画像、動画、音声、ファイル）
-            if message_type in ["image", "video", "audio", "file"]:
+            if content_type in _BINARY_CONTENT_TYPES:
                 # S3への保存はstorage.pyで行うため、ここではURIは設定しない
                 pass
 
@@ -11,10 +11,24 @@ from typing import Any, Dict, Optional
 # Lambda実行環境でのモジュールインポートを確保
 try:
     from common.message import UnifiedMessage
-    from normalizers.base_normalizer import BaseNormalizer
+    from normalizers.base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 except ImportError:
     from ..common.message import UnifiedMessage
-    from .base_normalizer import BaseNormalizer
+    from .base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 
 # ログ設定
 logger = logging.getLogger()
@@ -70,7 +84,7 @@ class SlackNormalizer(BaseNormalizer):
             room_key = f"slack:{team_id}:{channel}"
 
             # コンテンツタイプの判定（添付ファイルがあれば）
-            content_type = "text"
+            content_type = CONTENT_TYPE_TEXT
             s3_uri = None
 
             # 添付ファイルの処理
@@ -105,10 +119,10 @@ class SlackNormalizer(BaseNormalizer):
         mime_type = file.get("mimetype", "")
 
         if mime_type.startswith("image/"):
-            return "image"
+            return CONTENT_TYPE_IMAGE
         elif mime_type.startswith("video/"):
-            return "video"
+            return CONTENT_TYPE_VIDEO
         elif mime_type.startswith("audio/"):
-            return "audio"
+            return CONTENT_TYPE_AUDIO
         else:
-            return "file"
+            return CONTENT_TYPE_FILE
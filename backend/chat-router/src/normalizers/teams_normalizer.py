@@ -9,10 +9,24 @@ from typing import Any, Dict, Optional
 # Lambda実行環境でのモジュールインポートを確保
 try:
     from common.message import UnifiedMessage
-    from normalizers.base_normalizer import BaseNormalizer
+    from normalizers.base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 except ImportError:
     from ..common.message import UnifiedMessage
-    from .base_normalizer import BaseNormalizer
+    from .base_normalizer import (
+        CONTENT_TYPE_AUDIO,
+        CONTENT_TYPE_FILE,
+        CONTENT_TYPE_IMAGE,
+        CONTENT_TYPE_TEXT,
+        CONTENT_TYPE_VIDEO,
+        BaseNormalizer,
+    )
 
 # ログ設定
 logger = logging.getLogger()
@@ -54,7 +68,7 @@ class TeamsNormalizer(BaseNormalizer):
             room_key = f"teams:{tenant_id}:{conversation_id}"
 
             # コンテンツタイプの判定
-            content_type = "text"
+            content_type = CONTENT_TYPE_TEXT
             s3_uri = None
 
             # 添付ファイルの処理
@@ -89,10 +103,10 @@ class TeamsNormalizer(BaseNormalizer):
         content_type = attachment.get("contentType", "")
 
         if "image" in content_type:
-            return "image"
+            return CONTENT_TYPE_IMAGE
         elif "video" in content_type:
-            return "video"
+            return CONTENT_TYPE_VIDEO
         elif "audio" in content_type:
-            return "audio"
+            return CONTENT_TYPE_AUDIO
         else:
-            return "file"
+            return CONTENT_TYPE_FILE
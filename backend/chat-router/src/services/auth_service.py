@@ -4,14 +4,11 @@
 """
 
 import json
-import hashlib
 import logging
-import os
 import secrets
 import time
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
-import boto3
 from botocore.exceptions import ClientError
 
 try:
@@ -20,60 +17,91 @@ try:
         extract_bearer_token,
         get_authenticated_session,
         get_authenticated_user,
+        hash_password,
+        settings_table,
+        upgrade_legacy_password_hash,
+        verify_password,
+    )
+    from common.utils import (
+        convert_decimal_to_int,
+        current_time_ms,
+        generate_time_ordered_uuid,
     )
-    from common.utils import convert_decimal_to_int, generate_time_ordered_uuid
 except ImportError:
     from ..common.responses import create_error_response, create_success_response
     from ..common.auth_utils import (
         extract_bearer_token,
         get_authenticated_session,
         get_authenticated_user,
+        hash_password,
+        settings_table,
+        upgrade_legacy_password_hash,
+        verify_password,
+    )
+    from ..common.utils import (
+        convert_decimal_to_int,
+        current_time_ms,
+        generate_time_ordered_uuid,
     )
-    from ..common.utils import convert_decimal_to_int, generate_time_ordered_uuid
 
 logger = logging.getLogger(__name__)
 
+# セッショントークンの有効期限（24時間）
+_TOKEN_EXPIRY_SECONDS = 86400
 
 class AuthService:
     """認証サービス"""
 
     def __init__(self):
         """初期化"""
-        # セッショントークンの有効期限（24時間）
-        self.token_expiry_seconds = 86400
-        # DynamoDB設定
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table_name = os.environ.get("CHATBOT_SETTINGS_TABLE", "ChatbotSettingsDB-dev")
-        self.table = self.dynamodb.Table(self.table_name)
-
-    def _hash_password(self, password: str) -> str:
-        """パスワードのハッシュ化（元の処理と同じ）
+        self.token_expiry_seconds = _TOKEN_EXPIRY_SECONDS
+        # DynamoDBテーブル（auth_utilsとコンテナ単位で共有）
+        self.table = settings_table
 
-        Args:
-            password: プレーンテキストのパスワード
+    def _generate_token(self) -> str:
+        """セッショントークンの生成
 
         Returns:
-            ハッシュ化されたパスワード
+            ランダムなトークン文字列（256ビット、16進数64桁）
         """
-        # SHA-256でハッシュ化（元の処理と同じ）
-        return hashlib.sha256(password.encode()).hexdigest()
+        return secrets.token_bytes(32).hex()
 
-    def _generate_token(self) -> str:
-        """セッショントークンの生成（元の処理と同じ）
+    def _build_session(self, user_id: str, email: str) -> Tuple[str, int, Dict[str, Any]]:
+        """セッション情報の生成
+
+        Args:
+            user_id: ユーザーID
+            email: メールアドレス
 
         Returns:
-            ランダムなトークン文字列
+            (トークン, 有効期限（秒）, セッションアイテム) のタプル
         """
-        return secrets.token_urlsafe(32)
+        token = self._generate_token()
+        current_time = int(time.time())
+        expiry_time = current_time + self.token_expiry_seconds
+
+        session_data = {
+            "PK": f"SESSION#{token}",
+            "SK": "INFO",
+            "userId": user_id,
+            "email": email,
+            "createdAt": current_time * 1000,
+            "expiresAt": expiry_time,
+            "ttl": expiry_time,  # DynamoDBのTTL機能用
+        }
+        return token, expiry_time, session_data
 
     def register(self, body: Union[str, Dict]) -> Dict[str, Any]:
-        """新規ユーザー登録（元の処理と同じ）
+        """新規ユーザー登録
+
+        リクエストボディのautoLoginがtrueの場合は登録と同時にセッションを発行し、
+        ユーザーとセッションを1回のBatchWriteItemで保存する
 
         Args:
             body: リクエストボディ
 
         Returns:
-            登録結果のレスポンス
+            登録結果のレスポンス（autoLogin時はtoken・expiresAtを含む）
         """
         try:
             # リクエストボディをパース
@@ -93,6 +121,7 @@ class AuthService:
             email = data["email"].lower()
             password = data["password"]
             name = data["name"]
+            auto_login = data.get("autoLogin") is True
 
             # メールアドレスの形式チェック
             if "@" not in email or len(email) < 5:
@@ -115,7 +144,7 @@ class AuthService:
 
             # 新しいユーザーデータを生成
             user_id = generate_time_ordered_uuid()
-            current_time = int(time.time() * 1000)  # ミリ秒
+            current_time = current_time_ms()  # ミリ秒
 
             # ユーザープロファイルを保存
             user_data = {
@@ -124,14 +153,21 @@ class AuthService:
                 "userId": user_id,
                 "email": email,
                 "name": name,
-                "passwordHash": self._hash_password(password),
+                "passwordHash": hash_password(password),
                 "role": "user",  # デフォルトロール
                 "createdAt": current_time,
                 "updatedAt": current_time,
                 "isActive": True,
             }
 
-            self.table.put_item(Item=user_data)
+            if auto_login:
+                # ユーザーとセッションをまとめて保存（1往復）
+                token, expiry_time, session_data = self._build_session(user_id, email)
+                with self.table.batch_writer() as writer:
+                    writer.put_item(Item=user_data)
+                    writer.put_item(Item=session_data)
+            else:
+                self.table.put_item(Item=user_data)
 
             logger.info(f"User registered successfully: {email}")
 
@@ -143,6 +179,11 @@ class AuthService:
                         response_data[k] = int(v)
                     else:
                         response_data[k] = v
+
+            if auto_login:
+                response_data["token"] = token
+                response_data["expiresAt"] = expiry_time * 1000
+
             return create_success_response(response_data)
 
         except json.JSONDecodeError:
@@ -196,13 +237,16 @@ class AuthService:
             user = response["Item"]
 
             # パスワードの検証
-            if user["passwordHash"] != self._hash_password(password):
+            if not verify_password(password, user.get("passwordHash", "")):
                 return create_error_response(
                     401,
                     "Unauthorized",
                     "メールアドレスまたはパスワードが正しくありません",
                 )
 
+            # 旧形式のハッシュはログイン成功時にscrypt形式へ移行
+            upgrade_legacy_password_hash(email, password, user["passwordHash"])
+
             # アクティブユーザーかチェック
             if not user.get("isActive", True):
                 return create_error_response(
@@ -210,21 +254,11 @@ class AuthService:
                 )
 
             # セッショントークンを生成
-            token = self._generate_token()
-            current_time = int(time.time())
-            expiry_time = current_time + self.token_expiry_seconds
-
-            # セッション情報を保存
-            session_data = {
-                "PK": f"SESSION#{token}",
-                "SK": "INFO",
-                "userId": user["userId"],
-                "email": email,
-                "createdAt": current_time * 1000,
-                "expiresAt": expiry_time,
-                "ttl": expiry_time,  # DynamoDBのTTL機能用
-            }
+            token, expiry_time, session_data = self._build_session(
+                user["userId"], email
+            )
 
+            # セッション情報を保存（単独ログインは従来通りput_item）
             self.table.put_item(Item=session_data)
 
             logger.info(f"User logged in successfully: {email}")
@@ -4,49 +4,58 @@
 """
 
 import json
-import hashlib
 import logging
-import os
 import secrets
-import time
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
-import boto3
 from botocore.exceptions import ClientError
 
 try:
     from common.responses import create_error_response, create_success_response
-    from common.auth_utils import get_authenticated_user
-    from common.utils import convert_decimal_to_int
+    from common.auth_utils import (
+        get_authenticated_user,
+        hash_password,
+        settings_table,
+    )
+    from common.utils import convert_decimal_to_int, current_time_ms, json_loads
 except ImportError:
     from ..common.responses import create_error_response, create_success_response
-    from ..common.auth_utils import get_authenticated_user
-    from ..common.utils import convert_decimal_to_int
+    from ..common.auth_utils import (
+        get_authenticated_user,
+        hash_password,
+        settings_table,
+    )
+    from ..common.utils import convert_decimal_to_int, current_time_ms, json_loads
 
 logger = logging.getLogger(__name__)
 
+# 更新対象フィールドのビットマスク
+_UPDATE_NAME = 0b01
+_UPDATE_PASSWORD = 0b10
+_UPDATE_NAME_AND_PASSWORD = _UPDATE_NAME | _UPDATE_PASSWORD
+
+# ビットマスク → (UpdateExpression, ExpressionAttributeNames)
+# nameはDynamoDBの予約語のためプレースホルダー経由で指定する
+_UPDATE_TEMPLATES: Dict[int, Tuple[str, Optional[Dict[str, str]]]] = {
+    _UPDATE_NAME: ("SET #n = :name, updatedAt = :updatedAt", {"#n": "name"}),
+    _UPDATE_PASSWORD: (
+        "SET passwordHash = :passwordHash, updatedAt = :updatedAt",
+        None,
+    ),
+    _UPDATE_NAME_AND_PASSWORD: (
+        "SET #n = :name, passwordHash = :passwordHash, updatedAt = :updatedAt",
+        {"#n": "name"},
+    ),
+}
+
 
 class ProfileService:
     """プロファイル管理サービス"""
 
     def __init__(self):
         """初期化"""
-        # DynamoDB設定
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table_name = os.environ.get("CHATBOT_SETTINGS_TABLE", "ChatbotSettingsDB-dev")
-        self.table = self.dynamodb.Table(self.table_name)
-
-    def _hash_password(self, password: str) -> str:
-        """パスワードのハッシュ化（元の処理と同じ）
-
-        Args:
-            password: プレーンテキストのパスワード
-
-        Returns:
-            ハッシュ化されたパスワード
-        """
-        # SHA-256でハッシュ化（元の処理と同じ）
-        return hashlib.sha256(password.encode()).hexdigest()
+        # DynamoDBテーブル（auth_utilsとコンテナ単位で共有）
+        self.table = settings_table
 
     def update_profile(
         self, body: Union[str, Dict], headers: Dict[str, str]
@@ -71,7 +80,7 @@ class ProfileService:
             # リクエストボディの解析
             if isinstance(body, str):
                 try:
-                    parsed_body = json.loads(body)
+                    parsed_body = json_loads(body)
                 except json.JSONDecodeError:
                     return create_error_response(
                         400, "Bad Request", "Invalid JSON format"
@@ -80,8 +89,9 @@ class ProfileService:
                 parsed_body = body
 
             # 更新可能なフィールドを取得
-            update_data = {}
-            current_time = int(time.time() * 1000)
+            update_mask = 0
+            expression_attribute_values = {}
+            current_time = current_time_ms()
 
             # 名前の更新
             if "name" in parsed_body:
@@ -90,9 +100,10 @@ class ProfileService:
                     return create_error_response(
                         400, "Bad Request", "Name cannot be empty"
                     )
-                update_data["name"] = name
+                update_mask |= _UPDATE_NAME
+                expression_attribute_values[":name"] = name
 
-            # パスワードの更新（元の処理と同じ）
+            # パスワードの更新
             if "password" in parsed_body:
                 new_password = parsed_body["password"]
                 if len(new_password) < 6:
@@ -100,39 +111,38 @@ class ProfileService:
                         400, "Bad Request", "パスワードは6文字以上で入力してください"
                     )
 
-                update_data["passwordHash"] = self._hash_password(new_password)
+                update_mask |= _UPDATE_PASSWORD
+                expression_attribute_values[":passwordHash"] = hash_password(
+                    new_password
+                )
 
             # 更新するデータがない場合
-            if not update_data:
+            if not update_mask:
                 return create_error_response(
                     400, "Bad Request", "No valid fields to update"
                 )
 
             # 更新時刻を設定
-            update_data["updatedAt"] = current_time
-
-            # DynamoDBを更新
-
-            # 更新式とAttributeValuesを動的に構築
-            update_expression_parts = []
-            expression_attribute_values = {}
-
-            for key, value in update_data.items():
-                update_expression_parts.append(f"{key} = :{key}")
-                expression_attribute_values[f":{key}"] = value
-
-            update_expression = "SET " + ", ".join(update_expression_parts)
+            expression_attribute_values[":updatedAt"] = current_time
+
+            # 更新フィールドの組み合わせに対応する更新式を選択
+            update_expression, expression_attribute_names = _UPDATE_TEMPLATES[
+                update_mask
+            ]
+            update_kwargs: Dict[str, Any] = {
+                "Key": {
+                    "PK": f"USER#{user['email']}",
+                    "SK": "PROFILE",
+                },
+                "UpdateExpression": update_expression,
+                "ExpressionAttributeValues": expression_attribute_values,
+                "ReturnValues": "ALL_NEW",
+            }
+            if expression_attribute_names:
+                update_kwargs["ExpressionAttributeNames"] = expression_attribute_names
 
             try:
-                response = self.table.update_item(
-                    Key={
-                        "PK": f"USER#{user['email']}",
-                        "SK": "PROFILE",
-                    },
-                    UpdateExpression=update_expression,
-                    ExpressionAttributeValues=expression_attribute_values,
-                    ReturnValues="ALL_NEW",
-                )
+                response = self.table.update_item(**update_kwargs)
 
                 updated_item = response["Attributes"]
                 logger.info(f"Profile updated successfully for user: {user['email']}")
@@ -3,30 +3,60 @@
 DynamoDBでのチャットメッセージの保存とS3でのバイナリデータの処理を行う
 """
 
-import base64
 import boto3
-import json
+import io
 import logging
 import mimetypes
 import os
 import time
-import uuid
-from typing import Any, Dict, Optional, BinaryIO, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, BinaryIO, Sequence, Union
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeSerializer
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# SIMD実装のpybase64が利用可能であれば使用し、無い環境では標準base64を使用
+try:
+    import pybase64 as b64
+except ImportError:
+    import base64 as b64
 
 # 新しい共通モジュールのインポート
 try:
     from common.message import UnifiedMessage
+    from common.utils import json_dumps
 except ImportError:
     from .common.message import UnifiedMessage
+    from .common.utils import json_dumps
 
 # ログ設定
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# AWS クライアント共通設定（接続プールとアダプティブリトライはコンテナ単位で一度だけ構成）
+# ウォームコンテナ間でTLS接続を維持するためTCPキープアライブを有効化する
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=1.0,
+)
+
 # AWS クライアント
-dynamodb = boto3.resource("dynamodb")
-s3_client = boto3.client("s3")
+dynamodb = boto3.resource("dynamodb", config=AWS_CLIENT_CONFIG)
+# シリアライズ済みアイテムを書き込むための低レベルクライアント
+# （リソースのmeta.clientは型変換が付与されており、二重にシリアライズされるため使わない）
+dynamodb_client = boto3.client("dynamodb", config=AWS_CLIENT_CONFIG)
+# S3クライアント（HTTPS上ではペイロードのSHA-256署名を省略）
+s3_upload_client = boto3.client(
+    "s3",
+    config=AWS_CLIENT_CONFIG.merge(
+        Config(signature_version="s3v4", s3={"payload_signing_enabled": False})
+    ),
+)
 
 # 環境変数から設定を取得
 CHAT_HISTORY_TABLE = os.environ.get("CHAT_HISTORY_TABLE", "ChatHistory")
@@ -36,6 +66,47 @@ CHATBOT_SETTINGS_TABLE = os.environ.get(
 )
 TTL_SECONDS = int(os.environ.get("TTL_SECONDS", 86400))  # 24時間
 
+# DynamoDBテーブル（コンテナ単位で再利用）
+chat_history_table = dynamodb.Table(CHAT_HISTORY_TABLE)
+settings_table = dynamodb.Table(CHATBOT_SETTINGS_TABLE)
+
+# S3アップロード設定（8MB以上はマルチパートで並列アップロード）
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True,
+    max_concurrency=4,
+)
+
+# 拡張子ごとのMIMEタイプ（_determine_extensionの既定値と主要な添付形式）
+_EXT_TO_MIME: Dict[str, str] = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "mp4": "video/mp4",
+    "mov": "video/quicktime",
+    "mp3": "audio/mpeg",
+    "m4a": "audio/mp4",
+    "wav": "audio/wav",
+    "pdf": "application/pdf",
+    "txt": "text/plain",
+    "bin": "application/octet-stream",
+}
+
+# roomKeyをS3キーに使う際の変換テーブル（コロン → アンダースコア）
+_ROOM_KEY_TRANSLATION = str.maketrans({":": "_"})
+
+# 文字列以外の値を低レベルAPI用に変換するシリアライザー
+_type_serializer = TypeSerializer()
+
+# S3アップロードとDynamoDB書き込みを並行実行するスレッドプール（コンテナ単位で再利用）
+_io_executor = ThreadPoolExecutor(max_workers=4)
+
+# メッセージ履歴の表示に必要な属性
+MESSAGE_ATTRIBUTES = ("SK", "role", "text", "contentType", "s3Uri")
+
 
 def save_message(message: UnifiedMessage) -> Dict[str, Any]:
     """メッセージをDynamoDBに保存し、バイナリデータがあればS3に保存
@@ -47,36 +118,20 @@ def save_message(message: UnifiedMessage) -> Dict[str, Any]:
         保存されたアイテムの詳細を含む辞書
     """
     try:
-        # DynamoDBテーブルの取得
-        table = dynamodb.Table(CHAT_HISTORY_TABLE)
-
         # TTLの計算（現在時刻 + 24時間）
         ttl = int(time.time()) + TTL_SECONDS
 
         # DynamoDBに保存するアイテムの作成
-        # タイムスタンプを0パディングした文字列に変換（ソート順を保証）
-        item = {
-            "PK": message.room_key,
-            "SK": f"{message.ts:019d}",  # 19桁にゼロパディング（ミリ秒タイムスタンプに対応）
-            "role": message.role,
-            "contentType": message.content_type,
-            "ttl": ttl,
-        }
-
-        # テキストがあれば追加
-        if message.text:
-            item["text"] = message.text
+        item = _build_message_item(message, ttl)
 
-        # S3 URIがあれば追加
-        if message.s3_uri:
-            item["s3Uri"] = message.s3_uri
-
-        # DynamoDBに保存
-        table.put_item(Item=item)
+        # DynamoDBに保存（固定スキーマのため低レベルAPIへ直接渡す）
+        dynamodb_client.put_item(
+            TableName=CHAT_HISTORY_TABLE, Item=_serialize_message_item(item)
+        )
 
         logger.info(
             "Message saved to DynamoDB: %s",
-            json.dumps(
+            json_dumps(
                 {
                     "roomKey": message.room_key,
                     "ts": message.ts,
@@ -90,11 +145,95 @@ def save_message(message: UnifiedMessage) -> Dict[str, Any]:
             "message": "Message saved successfully",
             "item": item,
         }
-    except Exception as e:
+    except ClientError as e:
         logger.error("Error saving message to DynamoDB: %s", str(e))
         raise
 
 
+def save_messages(messages: List[UnifiedMessage]) -> Dict[str, Any]:
+    """複数のメッセージをBatchWriteItemでまとめてDynamoDBに保存
+
+    batch_writerが25件ごとの分割とUnprocessedItemsの再送を行う。
+    同一PK/SKのメッセージ（再送イベントなど）はバッチ内で重複排除される
+
+    Args:
+        messages: 保存する正規化されたメッセージのリスト
+
+    Returns:
+        保存件数を含む辞書
+    """
+    try:
+        # TTLの計算（現在時刻 + 24時間）
+        ttl = int(time.time()) + TTL_SECONDS
+
+        with chat_history_table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as writer:
+            for message in messages:
+                writer.put_item(Item=_build_message_item(message, ttl))
+
+        logger.info("Saved %d messages to DynamoDB in batch", len(messages))
+
+        return {
+            "status": "success",
+            "message": "Messages saved successfully",
+            "count": len(messages),
+        }
+    except ClientError as e:
+        logger.error("Error saving messages to DynamoDB: %s", str(e))
+        raise
+
+
+def _build_message_item(message: UnifiedMessage, ttl: int) -> Dict[str, Any]:
+    """DynamoDBに保存するメッセージアイテムを作成
+
+    Args:
+        message: 正規化されたメッセージ
+        ttl: 有効期限（UNIX秒）
+
+    Returns:
+        DynamoDBアイテム
+    """
+    # タイムスタンプを0パディングした文字列に変換（ソート順を保証）
+    item = {
+        "PK": message.room_key,
+        "SK": f"{message.ts:019d}",  # 19桁にゼロパディング（ミリ秒タイムスタンプに対応）
+        "role": message.role,
+        "contentType": message.content_type,
+        "ttl": ttl,
+    }
+
+    # テキストがあれば追加
+    if message.text:
+        item["text"] = message.text
+
+    # S3 URIがあれば追加
+    if message.s3_uri:
+        item["s3Uri"] = message.s3_uri
+
+    return item
+
+
+def _serialize_message_item(item: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """メッセージアイテムを低レベルAPI用のAttributeValue形式に変換
+
+    通常は文字列のみのため直接変換し、カスタムUIから数値やnullが渡された場合など
+    文字列以外の値だけTypeSerializerで変換する
+
+    Args:
+        item: _build_message_itemで作成したアイテム
+
+    Returns:
+        AttributeValue形式のアイテム
+    """
+    return {
+        key: (
+            {"S": value}
+            if isinstance(value, str)
+            else _type_serializer.serialize(value)
+        )
+        for key, value in item.items()
+    }
+
+
 def save_binary_to_s3(
     message: UnifiedMessage,
     binary_data: Union[bytes, BinaryIO],
@@ -113,22 +252,9 @@ def save_binary_to_s3(
     try:
         # ファイル拡張子の決定
         ext = file_extension or _determine_extension(binary_data, message.content_type)
+        object_key = _build_object_key(message, ext)
 
-        # S3オブジェクトキーの生成: <platform>/<roomKey>/<ts>.<ext>
-        # roomKeyにはプラットフォーム名が含まれているが、S3パスでも明示的に分ける
-        platform = message.platform
-        room_key_safe = message.room_key.replace(
-            ":", "_"
-        )  # コロンをアンダースコアに置換
-        object_key = f"{platform}/{room_key_safe}/{message.ts}.{ext}"
-
-        # S3にアップロード
-        s3_client.put_object(
-            Bucket=CHAT_ASSETS_BUCKET,
-            Key=object_key,
-            Body=binary_data,
-            ContentType=_get_content_type(ext),
-        )
+        _upload_binary(object_key, binary_data, ext)
 
         # S3 URIを返す
         s3_uri = f"s3://{CHAT_ASSETS_BUCKET}/{object_key}"
@@ -136,48 +262,164 @@ def save_binary_to_s3(
         logger.info("Binary data saved to S3: %s", s3_uri)
 
         return s3_uri
-    except Exception as e:
+    except (ClientError, S3UploadFailedError) as e:
         logger.error("Error saving binary data to S3: %s", str(e))
         raise
 
 
-def get_recent_messages(room_key: str, limit: int = 6) -> list:
+def save_message_with_binary(
+    message: UnifiedMessage,
+    binary_data: Union[str, bytes, BinaryIO],
+    file_extension: Optional[str] = None,
+) -> Dict[str, Any]:
+    """バイナリデータ付きメッセージを保存
+
+    S3のオブジェクトキーは事前に決まるため、S3アップロードとDynamoDB書き込みを
+    並行実行する。S3への保存に失敗した場合はS3 URIを除いてメッセージを保存し直す。
+
+    Args:
+        message: 正規化されたメッセージ
+        binary_data: バイナリデータ（base64文字列、バイト、またはファイルライクオブジェクト）
+        file_extension: オプションのファイル拡張子
+
+    Returns:
+        保存されたアイテム
+    """
+    binary_data = _decode_binary_data(binary_data)
+    if not binary_data:
+        return save_message(message)
+
+    ext = file_extension or _determine_extension(binary_data, message.content_type)
+    object_key = _build_object_key(message, ext)
+    message.s3_uri = f"s3://{CHAT_ASSETS_BUCKET}/{object_key}"
+
+    # S3アップロードをバックグラウンドで開始し、その間にDynamoDBへ書き込む
+    upload_future = _io_executor.submit(_upload_binary, object_key, binary_data, ext)
+    item = save_message(message)
+
+    try:
+        upload_future.result()
+        logger.info("Binary data saved to S3: %s", message.s3_uri)
+    except Exception as e:
+        logger.error("Error saving binary data to S3: %s", str(e))
+        message.s3_uri = None
+        item = save_message(message)
+
+    return item
+
+
+def _build_object_key(message: UnifiedMessage, ext: str) -> str:
+    """S3オブジェクトキーを生成
+
+    Args:
+        message: 正規化されたメッセージ
+        ext: ファイル拡張子
+
+    Returns:
+        S3オブジェクトキー
+    """
+    # S3オブジェクトキーの生成: <platform>/<roomKey>/<ts>.<ext>
+    # roomKeyにはプラットフォーム名が含まれているが、S3パスでも明示的に分ける
+    platform = message.platform
+    room_key_safe = message.room_key.translate(
+        _ROOM_KEY_TRANSLATION
+    )  # コロンをアンダースコアに置換
+    return f"{platform}/{room_key_safe}/{message.ts}.{ext}"
+
+
+def _upload_binary(
+    object_key: str, binary_data: Union[bytes, BinaryIO], ext: str
+) -> None:
+    """バイナリデータをS3にアップロード
+
+    Args:
+        object_key: S3オブジェクトキー
+        binary_data: アップロードするバイナリデータ
+        ext: ファイル拡張子
+    """
+    # S3にアップロード（大きなデータはマルチパートで並列アップロード）
+    fileobj = (
+        io.BytesIO(binary_data)
+        if isinstance(binary_data, (bytes, bytearray))
+        else binary_data
+    )
+    s3_upload_client.upload_fileobj(
+        fileobj,
+        CHAT_ASSETS_BUCKET,
+        object_key,
+        ExtraArgs={"ContentType": _get_content_type(ext)},
+        Config=S3_TRANSFER_CONFIG,
+    )
+
+
+def get_recent_messages(
+    room_key: str,
+    limit: int = 6,
+    attributes: Optional[Sequence[str]] = MESSAGE_ATTRIBUTES,
+) -> list:
     """ルームの最近のメッセージを取得
 
     Args:
         room_key: ルームキー
         limit: 取得するメッセージの最大数（デフォルト: 6、3回の会話分）
+        attributes: 取得する属性名（デフォルト: 履歴表示用の属性、Noneで全属性）
 
     Returns:
         時系列順のメッセージリスト
     """
     try:
-        # DynamoDBテーブルの取得
-        table = dynamodb.Table(CHAT_HISTORY_TABLE)
-
         # クエリの実行（降順で取得）
-        response = table.query(
-            KeyConditionExpression="PK = :pk",
-            ExpressionAttributeValues={":pk": room_key},
-            ScanIndexForward=False,  # 降順（新しい順）
-            Limit=limit,
-        )
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk",
+            "ExpressionAttributeValues": {":pk": room_key},
+            "ScanIndexForward": False,  # 降順（新しい順）
+            "Limit": limit,
+            "ReturnConsumedCapacity": "NONE",
+        }
+        if attributes:
+            query_kwargs.update(_build_projection(attributes))
+
+        # 1MB上限などでページが分割された場合はlimit件に達するまで続きを取得
+        items: List[Dict[str, Any]] = []
+        while True:
+            response = chat_history_table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
 
-        # 結果を取得
-        items = response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key or len(items) >= limit:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+            query_kwargs["Limit"] = limit - len(items)
 
-        # タイムスタンプで昇順にソート（古い順）
-        # SKはゼロパディングされた文字列なので、文字列ソートで時系列順になる
-        items.sort(key=lambda x: x["SK"])
+        # 降順で取得済みなので反転して昇順（古い順）にする
+        items.reverse()
 
         logger.info("Retrieved %d messages for room %s", len(items), room_key)
 
         return items
-    except Exception as e:
+    except ClientError as e:
         logger.error("Error retrieving messages from DynamoDB: %s", str(e))
         raise
 
 
+def _build_projection(attributes: Sequence[str]) -> Dict[str, Any]:
+    """クエリ用のProjectionExpressionを生成
+
+    role・text・ttlなどの予約語を避けるため、全属性をプレースホルダー経由で指定する
+
+    Args:
+        attributes: 取得する属性名
+
+    Returns:
+        ProjectionExpressionとExpressionAttributeNamesを含む辞書
+    """
+    names = {f"#p{i}": attribute for i, attribute in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
+
+
 def _determine_extension(binary_data: Union[bytes, BinaryIO], content_type: str) -> str:
     """バイナリデータとコンテンツタイプに基づいてファイル拡張子を決定
 
@@ -208,55 +450,43 @@ def _get_content_type(extension: str) -> str:
     Returns:
         MIMEタイプ
     """
+    mime_type = _EXT_TO_MIME.get(extension.lower())
+    if mime_type:
+        return mime_type
+
+    # 表にない拡張子（呼び出し元が指定したfileExtension）のみmimetypesで解決する
     return mimetypes.guess_type(f"file.{extension}")[0] or "application/octet-stream"
 
 
-def process_binary_data(
-    message: UnifiedMessage,
-    binary_data: Optional[Union[str, bytes, BinaryIO]] = None,
-    file_extension: Optional[str] = None,
-) -> UnifiedMessage:
-    """バイナリデータを処理し、S3 URIでメッセージを更新
+def _decode_binary_data(
+    binary_data: Union[str, bytes, BinaryIO],
+) -> Optional[Union[bytes, BinaryIO]]:
+    """Base64文字列の場合はデコード
 
     Args:
-        message: 正規化されたメッセージ
         binary_data: バイナリデータ（base64文字列、バイト、またはファイルライクオブジェクト）
-        file_extension: オプションのファイル拡張子
 
     Returns:
-        S3 URIで更新されたメッセージ
+        デコード済みのバイナリデータ、デコードに失敗した場合はNone
     """
-    if not binary_data:
-        return message
+    if not isinstance(binary_data, str):
+        return binary_data
 
     try:
-        # Base64文字列の場合はデコード
-        if isinstance(binary_data, str):
-            try:
-                binary_data = base64.b64decode(binary_data)
-            except Exception as e:
-                logger.error("Error decoding base64 data: %s", str(e))
-                return message
-
-        # S3に保存
-        s3_uri = save_binary_to_s3(message, binary_data, file_extension)
-
-        # メッセージを更新
-        message.s3_uri = s3_uri
-
-        return message
+        return b64.b64decode(binary_data, validate=False)
     except Exception as e:
-        logger.error("Error processing binary data: %s", str(e))
-        return message
+        logger.error("Error decoding base64 data: %s", str(e))
+        return None
 
 
 class DynamoDBManager:
     """DynamoDB操作を管理するクラス"""
 
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb")
-        self.settings_table = self.dynamodb.Table(CHATBOT_SETTINGS_TABLE)
-        self.chat_table = self.dynamodb.Table(CHAT_HISTORY_TABLE)
+        # モジュールで共有するリソースを利用
+        self.dynamodb = dynamodb
+        self.settings_table = settings_table
+        self.chat_table = chat_history_table
 
     def get_bot_settings(self, bot_id: str) -> Dict[str, Any]:
         """ボット設定を取得
@@ -10,13 +10,15 @@ from typing import Any, Dict
 
 # Lambda実行環境でのモジュールインポートを確保
 try:
-    from common.responses import create_error_response
+    from common.responses import create_error_response, create_success_response
+    from handlers.base_handler import BaseWebhookHandler
     from handlers.slack_handler import SlackWebhookHandler
     from handlers.teams_handler import TeamsWebhookHandler
     from handlers.line_handler import LineWebhookHandler
     from handlers.custom_handler import CustomWebhookHandler
 except ImportError:
-    from .common.responses import create_error_response
+    from .common.responses import create_error_response, create_success_response
+    from .handlers.base_handler import BaseWebhookHandler
     from .handlers.slack_handler import SlackWebhookHandler
     from .handlers.teams_handler import TeamsWebhookHandler
     from .handlers.line_handler import LineWebhookHandler
@@ -32,32 +34,27 @@ LINE_CHANNEL_SECRET = os.environ.get("LINE_CHANNEL_SECRET", "")
 TEAMS_SECRET = os.environ.get("TEAMS_SECRET", "")
 CUSTOM_UI_SECRET = os.environ.get("CUSTOM_UI_SECRET", "")
 
-# ハンドラーインスタンス（シングルトン）
-_handler_instances: Dict[str, Any] = {}
+# Webhookパスとプラットフォームの対応表
+WEBHOOK_PLATFORMS: Dict[str, str] = {
+    "/webhook/custom": "custom",
+    "/webhook/line": "line",
+    "/webhook/slack": "slack",
+    "/webhook/teams": "teams",
+}
 
+# プラットフォームごとのハンドラーインスタンス（初期化フェーズで生成し、コンテナ単位で再利用）
+_HANDLERS: Dict[str, BaseWebhookHandler] = {
+    "slack": SlackWebhookHandler(SLACK_SIGNING_SECRET),
+    "teams": TeamsWebhookHandler(TEAMS_SECRET),
+    "line": LineWebhookHandler(LINE_CHANNEL_SECRET),
+    "custom": CustomWebhookHandler(CUSTOM_UI_SECRET),
+}
 
-def _get_handler(platform: str):
-    """プラットフォーム用のハンドラーインスタンスを取得（シングルトン）
 
-    Args:
-        platform: プラットフォーム名
-
-    Returns:
-        該当するハンドラーインスタンス
-    """
-    if platform not in _handler_instances:
-        if platform == "slack":
-            _handler_instances[platform] = SlackWebhookHandler(SLACK_SIGNING_SECRET)
-        elif platform == "teams":
-            _handler_instances[platform] = TeamsWebhookHandler(TEAMS_SECRET)
-        elif platform == "line":
-            _handler_instances[platform] = LineWebhookHandler(LINE_CHANNEL_SECRET)
-        elif platform == "custom":
-            _handler_instances[platform] = CustomWebhookHandler(CUSTOM_UI_SECRET)
-        else:
-            raise ValueError(f"Unknown platform: {platform}")
-
-    return _handler_instances[platform]
+# Webhookパスから直接ハンドラーを引くための対応表
+_HANDLERS_BY_PATH: Dict[str, BaseWebhookHandler] = {
+    path: _HANDLERS[platform] for path, platform in WEBHOOK_PLATFORMS.items()
+}
 
 
 def handle_webhook_request(
@@ -78,6 +75,10 @@ def handle_webhook_request(
     try:
         logger.info("Processing webhook request: path=%s, method=%s", path, method)
 
+        # ウォームアップ用のpingはプラットフォームハンドラーを経由せずに応答
+        if path == "/webhook/ping":
+            return create_success_response({"status": "warm"})
+
         # POSTメソッド以外は405エラー
         if method != "POST":
             return create_error_response(
@@ -85,21 +86,13 @@ def handle_webhook_request(
             )
 
         # パス別の処理振り分け
-        platform_map = {
-            "/webhook/custom": "custom",
-            "/webhook/line": "line",
-            "/webhook/slack": "slack",
-            "/webhook/teams": "teams",
-        }
-
-        platform = platform_map.get(path)
-        if not platform:
+        handler = _HANDLERS_BY_PATH.get(path)
+        if handler is None:
             return create_error_response(
                 404, "Not Found", f"Webhook endpoint not found: {path}"
             )
 
         # 該当プラットフォームのハンドラーに処理を委譲
-        handler = _get_handler(platform)
         return handler.handle(body, event)
 
     except Exception as e:  # pylint: disable=broad-except
@@ -32,10 +32,8 @@ const Login: React.FC<LoginProps> = ({ onLogin }) => {
           return;
         }
         
-        // ユーザー登録
+        // ユーザー登録（レスポンスのセッショントークンでそのままログイン状態になる）
         await api.register(email, password, name);
-        // 登録後、自動的にログイン
-        await api.login(email, password);
       } else {
         // ログイン
         await api.login(email, password);
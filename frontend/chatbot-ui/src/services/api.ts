@@ -116,15 +116,22 @@ class ApiClient {
 
   // 認証API
   async register(email: string, password: string, name: string) {
+    // autoLogin: 登録と同時にセッションを発行してもらい、ログインの往復を省く
     const response = await this.request<{
       userId: string;
       email: string;
       name: string;
       role: string;
+      token: string;
+      expiresAt: number;
     }>('/api/auth/register', {
       method: 'POST',
-      body: JSON.stringify({ email, password, name }),
+      body: JSON.stringify({ email, password, name, autoLogin: true }),
     });
+
+    // トークンを保存
+    setToken(response.token);
+
     return response;
   }
 
@@ -3,7 +3,7 @@ Write-Host "チャットボットプロジェクトを起動しています..."
 
 # バックエンド起動 (SAM)
 Write-Host "バックエンドを起動中..." -ForegroundColor Yellow
-Start-Process -FilePath "powershell" -ArgumentList "-Command", "cd backend/chat-router; sam build; sam local start-api" -WindowStyle Normal
+Start-Process -FilePath "powershell" -ArgumentList "-Command", "cd backend/chat-router; sam build --use-container; sam local start-api" -WindowStyle Normal
 
 # 1秒待機
 Start-Sleep -Seconds 1